@@ -42,6 +42,30 @@ class Settings(BaseSettings):
     # on a single output-guardrail call).
     guardrail_model: str = "openai:gpt-4.1-mini"
     guardrails_enabled: bool = False
+    # Short messages that fully match one of these (case-insensitive) regexes
+    # are allowed without a guardrail LLM call: a bare greeting or thanks
+    # carries no injection or abuse. Empty list = every message is judged.
+    guardrail_input_allowlist: list[str] = Field(
+        default_factory=lambda: [
+            r"(oi|ol[aá]|hi|hello|hey|bom dia|boa tarde|boa noite)[\s!.,]*",
+            r"(obrigad[oa]|valeu|thanks|thank you|ok|tchau)[\s!.,]*",
+        ]
+    )
+    guardrail_allowlist_max_chars: int = Field(default=40, ge=0)
+    # Inputs containing a match for one of these (case-insensitive) regexes are
+    # blocked as prompt injection without a guardrail LLM call. Keep them
+    # high-precision: ambiguous messages belong to the LLM judge.
+    guardrail_input_blocklist: list[str] = Field(
+        default_factory=lambda: [
+            r"\bignore\s+(all\s+|the\s+|your\s+)?(previous|prior|above)\s+instructions\b",
+            r"\bignor[ea]\s+(todas\s+)?(as\s+|suas\s+)?instru[cç][oõ]es\s+anteriores\b",
+            r"\b(reveal|show|print|repeat)\s+(me\s+)?(your|the)\s+system\s+prompt\b",
+            r"\b(revele|mostre|imprima|repita)\s+(o\s+|seu\s+)?prompt\s+d[eo]\s+sistema\b",
+        ]
+    )
+    # Input verdicts are cached per exact message (0 entries = no cache)
+    guardrail_cache_size: int = Field(default=1024, ge=0)
+    guardrail_cache_ttl_seconds: int = Field(default=300, ge=0)
     # RAGAS judge — a non-reasoning model: reasoning models burn the token
     # budget before emitting the structured judge output (IncompleteOutput).
     ragas_model: str = "gpt-4.1-mini"
@@ -49,6 +73,9 @@ class Settings(BaseSettings):
     # timeout, so worst-case wall time per logical call is ~3x these values.
     llm_request_timeout_seconds: int = 120
     guardrail_timeout_seconds: int = 30
+    # The router may delegate to several specialists in one step; pydantic-ai
+    # runs those calls concurrently, bounded by this many at a time.
+    max_concurrent_specialists: int = Field(default=4, ge=1)
     # How long a chat turn blocks waiting for the human's Telegram reply in a
     # consult_human round before telling the customer a specialist will follow up.
     consultation_timeout_seconds: int = 120
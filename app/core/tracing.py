@@ -19,7 +19,7 @@ never break the product path.
 
 import logging
 from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from typing import Any, Literal
 
 from .config import Settings
@@ -27,6 +27,8 @@ from .config import Settings
 logger = logging.getLogger(__name__)
 
 _initialized = False
+_client: Any = None
+_propagate_attributes: Any = None
 
 REVIEW_QUEUE_NAME = "chat-review"
 
@@ -35,9 +37,14 @@ def is_tracing_enabled() -> bool:
     return _initialized
 
 
+def get_langfuse() -> Any:
+    """The Langfuse client created by ``setup_tracing`` (None when disabled)."""
+    return _client
+
+
 def setup_tracing(settings: Settings) -> bool:
     """Initialize Langfuse + pydantic-ai instrumentation. Safe to call twice."""
-    global _initialized
+    global _initialized, _client, _propagate_attributes
     if not settings.langfuse_enabled:
         return False
     if not (settings.langfuse_public_key and settings.langfuse_secret_key):
@@ -47,14 +54,15 @@ def setup_tracing(settings: Settings) -> bool:
         return True
 
     try:
-        from langfuse import Langfuse
+        from langfuse import Langfuse, propagate_attributes
         from pydantic_ai import Agent
 
-        Langfuse(
+        _client = Langfuse(
             public_key=settings.langfuse_public_key,
             secret_key=settings.langfuse_secret_key,
             host=settings.langfuse_host,
         )
+        _propagate_attributes = propagate_attributes
         Agent.instrument_all()
         _initialized = True
         logger.info("Langfuse tracing enabled (host=%s)", settings.langfuse_host)
@@ -69,21 +77,24 @@ def shutdown_tracing() -> None:
     if not _initialized:
         return
     try:
-        from langfuse import get_client
-
-        get_client().flush()
+        _client.flush()
     except Exception:  # noqa: BLE001
         logger.debug("Langfuse flush failed on shutdown", exc_info=True)
 
 
+def propagate_attributes(**attributes: Any) -> AbstractContextManager[Any]:
+    """Langfuse ``propagate_attributes`` (resolved once at setup); no-op when disabled."""
+    if not _initialized:
+        return nullcontext()
+    return _propagate_attributes(**attributes)
+
+
 def current_trace_id() -> str | None:
     """Trace id of the currently active span context (None when disabled)."""
     if not _initialized:
         return None
     try:
-        from langfuse import get_client
-
-        return get_client().get_current_trace_id()
+        return _client.get_current_trace_id()
     except Exception:  # noqa: BLE001
         return None
 
@@ -105,21 +116,13 @@ def chat_turn_span(
         yield None
         return
 
-    try:
-        from langfuse import get_client, propagate_attributes
-
-        langfuse = get_client()
-    except Exception:  # noqa: BLE001
-        yield None
-        return
-
     # propagate_attributes stamps session/user/tags on the root span AND every
     # child span (model requests, tool calls, guardrails) created inside it —
     # this is what groups traces by conversation/user in the Langfuse UI.
-    with langfuse.start_as_current_observation(
+    with _client.start_as_current_observation(
         name="chat_turn", as_type="agent", input={"message": user_message}
     ) as span:
-        with propagate_attributes(
+        with _propagate_attributes(
             user_id=user_ref,
             session_id=session_id,
             tags=[f"channel:{channel}"],
@@ -142,9 +145,7 @@ def _create_score(**kwargs: Any) -> bool:
     if not _initialized:
         return False
     try:
-        from langfuse import get_client
-
-        get_client().create_score(**kwargs)
+        _client.create_score(**kwargs)
         return True
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create Langfuse score %s: %s", kwargs.get("name"), exc)
@@ -207,10 +208,9 @@ def enqueue_for_review(trace_id: str, comment: str | None = None) -> bool:
     if not _initialized:
         return False
     try:
-        from langfuse import get_client
         from langfuse.api import AnnotationQueueObjectType
 
-        client = get_client()
+        client = _client
         queues = client.api.annotation_queues.list_queues()
         queue = next((q for q in queues.data if q.name == REVIEW_QUEUE_NAME), None)
         if queue is None:
@@ -23,6 +23,7 @@ from app.modules.chat import models as _chat_models  # noqa: F401
 from app.modules.chat.api import legacy_router
 from app.modules.evaluation import models as _evaluation_models  # noqa: F401
 from app.modules.evaluation.seeds import seed_golden_items
+from app.modules.guardrails.service import GuardrailService
 from app.modules.integrations import models as _integrations_models  # noqa: F401
 from app.modules.knowledge import models as _knowledge_models  # noqa: F401
 from app.modules.knowledge.graph_store import Neo4jGraphStore
@@ -110,6 +111,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             except Exception as exc:  # noqa: BLE001 — graph is optional at boot
                 logger.warning("Neo4j schema init failed (graph_search degraded): %s", exc)
 
+        # Guardrails (shared so the verdict cache outlives a request)
+        app.state.guardrail_service = GuardrailService(settings)
+
         # Rate limiter (login)
         app.state.login_rate_limiter = SlidingWindowRateLimiter(
             settings.login_rate_limit_attempts, settings.login_rate_limit_window_seconds
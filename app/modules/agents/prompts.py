@@ -17,7 +17,7 @@ Management under the name ``agent-{slug}`` with the ``production`` label:
 import logging
 from typing import Any
 
-from app.core.tracing import is_tracing_enabled
+from app.core.tracing import get_langfuse, is_tracing_enabled
 
 from .models import Agent
 
@@ -40,9 +40,7 @@ def resolve_agent_instructions(agent: Agent) -> tuple[str, Any | None]:
     if not is_tracing_enabled():
         return agent.instructions, None
     try:
-        from langfuse import get_client
-
-        prompt = get_client().get_prompt(
+        prompt = get_langfuse().get_prompt(
             prompt_name_for(agent.slug),
             label=PROMPT_LABEL,
             fallback=agent.instructions,
@@ -61,13 +59,7 @@ async def sync_prompts_to_langfuse(agents: list[Agent]) -> None:
     """Create missing Langfuse prompts from DB baselines (never overwrites)."""
     if not is_tracing_enabled():
         return
-    try:
-        from langfuse import get_client
-
-        client = get_client()
-    except Exception:  # noqa: BLE001
-        return
-
+    client = get_langfuse()
     for agent in agents:
         name = prompt_name_for(agent.slug)
         try:
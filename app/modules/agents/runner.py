@@ -14,16 +14,19 @@ Specialist agents are exposed to the router as tools ("agent-as-tool");
 their tool calls are recorded as nested steps.
 """
 
+import asyncio
 import logging
 import time
 from collections.abc import Awaitable, Callable
 from contextlib import nullcontext
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent as PydanticAgent
+from pydantic_ai import RunContext, Tool
 from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
@@ -34,10 +37,12 @@ from pydantic_ai.messages import (
 from pydantic_ai.settings import ModelSettings
 
 from app.core.config import Settings
+from app.core.tracing import propagate_attributes
 from app.modules.tools.schemas import StepRecord
-from app.modules.tools.service import ToolRegistry, ToolRunContext, ToolSpec
+from app.modules.tools.service import ToolHandler, ToolRegistry, ToolRunContext
 
 from .models import Agent
+from .prompts import resolve_agent_instructions
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +70,15 @@ class HistoryTurn:
     content: str
 
 
+@dataclass
+class _RunDeps:
+    """Per-run state handed to the shared tool functions as pydantic-ai deps."""
+
+    runner: "AgentRunner"
+    ctx: ToolRunContext
+    steps: list[StepRecord]
+
+
 class AgentRunner:
     """Builds and runs a pydantic-ai agent from a DB agent definition."""
 
@@ -77,6 +91,14 @@ class AgentRunner:
         self.settings = settings
         self.tool_registry = tool_registry
         self.specialists = specialists or []
+        self._specialists_by_slug = {s.slug: s for s in self.specialists}
+        # Built agents, keyed by (agent id, include_specialists). A runner
+        # lives for one chat turn, so a specialist the router delegates to
+        # several times is assembled (and its prompt resolved) only once.
+        self._agents: dict[tuple[str, bool], tuple[PydanticAgent[_RunDeps, str], Any]] = {}
+        # pydantic-ai runs the tool calls of one model response concurrently;
+        # this bounds how many specialist delegations are in flight at once.
+        self._specialist_slots = asyncio.Semaphore(settings.max_concurrent_specialists)
 
     async def run(
         self,
@@ -87,12 +109,13 @@ class AgentRunner:
     ) -> RunOutcome:
         steps: list[StepRecord] = []
         ctx.current_agent_label = agent.name
-        pyd_agent, prompt_client = self._build_agent(agent, ctx, steps, include_specialists=True)
+        pyd_agent, prompt_client = self._build_agent(agent, include_specialists=True)
 
         with self._prompt_link(prompt_client):
             result = await pyd_agent.run(
                 user_message,
                 message_history=self._build_message_history(history),
+                deps=_RunDeps(self, ctx, steps),
             )
 
         usage = result.usage() if callable(result.usage) else result.usage
@@ -123,13 +146,14 @@ class AgentRunner:
         """
         steps: list[StepRecord] = []
         ctx.current_agent_label = agent.name
-        pyd_agent, prompt_client = self._build_agent(agent, ctx, steps, include_specialists=True)
+        pyd_agent, prompt_client = self._build_agent(agent, include_specialists=True)
 
         text_parts: list[str] = []
         with self._prompt_link(prompt_client):
             async with pyd_agent.run_stream(
                 user_message,
                 message_history=self._build_message_history(history),
+                deps=_RunDeps(self, ctx, steps),
             ) as stream:
                 async for delta in stream.stream_text(delta=True):
                     text_parts.append(delta)
@@ -147,6 +171,55 @@ class AgentRunner:
             output_tokens=output_tokens or 0,
         )
 
+    # ------------------------------------------------------------------
+    # Delegation
+    # ------------------------------------------------------------------
+
+    async def delegate(
+        self, slug: str, query: str, ctx: ToolRunContext, steps: list[StepRecord]
+    ) -> str:
+        """Run specialist *slug* on *query* and record it as a step in *steps*.
+
+        Called by the specialist's delegate tool; the specialist's own tool
+        calls are recorded as nested steps.
+        """
+        step_name = f"agent:{slug}"
+        specialist = self._specialists_by_slug[slug]
+        if ctx.on_step_start:
+            await ctx.on_step_start(step_name, {"query": query})
+        start = time.monotonic()
+        nested_steps: list[StepRecord] = []
+        # Delegations can run concurrently, so each one gets its own
+        # context labelled with the specialist instead of relabelling
+        # the shared one.
+        sub_ctx = replace(ctx, current_agent_label=specialist.name)
+        sub_agent, sub_prompt = self._build_agent(specialist, include_specialists=False)
+        try:
+            # Specialists run stateless on the delegated query; the router
+            # owns conversation continuity.
+            async with self._specialist_slots:
+                with self._prompt_link(sub_prompt):
+                    result = await sub_agent.run(
+                        query, deps=_RunDeps(self, sub_ctx, nested_steps)
+                    )
+            result_text = result.output
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Specialist '%s' failed: %s", slug, exc, exc_info=True)
+            result_text = f"Specialist '{slug}' failed: {exc}"
+
+        duration_ms = int((time.monotonic() - start) * 1000)
+        record = StepRecord(
+            tool=step_name,
+            args={"query": query},
+            result_preview=result_text[:RESULT_PREVIEW_CHARS],
+            duration_ms=duration_ms,
+            nested_steps=nested_steps or None,
+        )
+        steps.append(record)
+        if ctx.on_step_end:
+            await ctx.on_step_end(record)
+        return result_text
+
     # ------------------------------------------------------------------
     # Agent assembly
     # ------------------------------------------------------------------
@@ -154,31 +227,38 @@ class AgentRunner:
     def _build_agent(
         self,
         agent: Agent,
-        ctx: ToolRunContext,
-        steps: list[StepRecord],
         include_specialists: bool,
-    ) -> tuple[PydanticAgent, Any]:
-        from .prompts import resolve_agent_instructions
+    ) -> tuple[PydanticAgent[_RunDeps, str], Any]:
+        key = (agent.id, include_specialists)
+        built = self._agents.get(key)
+        if built is not None:
+            return built
 
         model = agent.model or self.settings.default_model
         instructions, prompt_client = resolve_agent_instructions(agent)
-        pyd_agent = PydanticAgent(
-            model=model,
-            instructions=(instructions, self._runtime_context(ctx)),
-            model_settings=ModelSettings(timeout=self.settings.llm_request_timeout_seconds),
-        )
 
+        tools: list[Tool[_RunDeps]] = []
         for tool_name in agent.tools or []:
             spec = self.tool_registry.get(tool_name)
             if spec is None:
                 logger.warning("Agent '%s' references unknown tool '%s'", agent.slug, tool_name)
                 continue
-            self._register_tool(pyd_agent, spec, ctx, steps)
+            tools.append(_spec_tool(spec.name, spec.description, spec.params_model, spec.handler))
 
         if include_specialists and agent.kind == "router":
             for specialist in self.specialists:
-                self._register_specialist(pyd_agent, specialist, ctx, steps)
+                tools.append(
+                    _specialist_tool(specialist.slug, specialist.name, specialist.description)
+                )
 
+        pyd_agent = PydanticAgent(
+            model=model,
+            instructions=(instructions, _runtime_instructions),
+            deps_type=_RunDeps,
+            tools=tools,
+            model_settings=ModelSettings(timeout=self.settings.llm_request_timeout_seconds),
+        )
+        self._agents[key] = (pyd_agent, prompt_client)
         return pyd_agent, prompt_client
 
     @staticmethod
@@ -187,113 +267,19 @@ class AgentRunner:
         if prompt_client is None:
             return nullcontext()
         try:
-            from langfuse import propagate_attributes
-
             return propagate_attributes(prompt=prompt_client)
         except Exception:  # noqa: BLE001
             return nullcontext()
 
-    def _runtime_context(self, ctx: ToolRunContext) -> str:
-        now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+    def runtime_context(self, ctx: ToolRunContext) -> str:
+        """Per-run instructions: current time, authenticated customer, session."""
+        now = _utc_timestamp(int(time.time()))
         return (
             f"Runtime context — current date/time: {now}. "
             f"You are talking to the authenticated customer '{ctx.user_ref}' "
             f"(session {ctx.session_id}). Reply in the same language the customer uses."
         )
 
-    def _register_tool(
-        self,
-        pyd_agent: PydanticAgent,
-        spec: ToolSpec,
-        ctx: ToolRunContext,
-        steps: list[StepRecord],
-    ) -> None:
-        params_model = spec.params_model
-        handler = spec.handler
-
-        async def tool_fn(params: params_model) -> str:  # type: ignore[valid-type]
-            args = params.model_dump(exclude_none=True)  # type: ignore[attr-defined]
-            if ctx.on_step_start:
-                await ctx.on_step_start(spec.name, args)
-            start = time.monotonic()
-            try:
-                result_text = await handler(ctx, params)
-            except Exception as exc:  # noqa: BLE001 — errors return to the LLM as text
-                logger.error("Tool '%s' failed: %s", spec.name, exc, exc_info=True)
-                result_text = f"Error in {spec.name}: {exc}"
-            duration_ms = int((time.monotonic() - start) * 1000)
-            record = StepRecord(
-                tool=spec.name,
-                args=args,
-                result_preview=result_text[:RESULT_PREVIEW_CHARS],
-                duration_ms=duration_ms,
-            )
-            steps.append(record)
-            if ctx.on_step_end:
-                await ctx.on_step_end(record)
-            return result_text
-
-        tool_fn.__name__ = spec.name
-        # Runtime signature is (func, /, *, name=..., description=...); mypy's
-        # overloads only model the pure-decorator forms.
-        pyd_agent.tool_plain(  # type: ignore[call-overload]
-            tool_fn, name=spec.name, description=spec.description
-        )
-
-    def _register_specialist(
-        self,
-        pyd_agent: PydanticAgent,
-        specialist: Agent,
-        ctx: ToolRunContext,
-        steps: list[StepRecord],
-    ) -> None:
-        async def delegate_fn(params: DelegateParams) -> str:
-            step_name = f"agent:{specialist.slug}"
-            if ctx.on_step_start:
-                await ctx.on_step_start(step_name, {"query": params.query})
-            start = time.monotonic()
-            nested_steps: list[StepRecord] = []
-            sub_agent, sub_prompt = self._build_agent(
-                specialist, ctx, nested_steps, include_specialists=False
-            )
-            previous_label = ctx.current_agent_label
-            ctx.current_agent_label = specialist.name
-            try:
-                # Specialists run stateless on the delegated query; the router
-                # owns conversation continuity.
-                with self._prompt_link(sub_prompt):
-                    result = await sub_agent.run(params.query)
-                result_text = result.output
-            except Exception as exc:  # noqa: BLE001
-                logger.error(
-                    "Specialist '%s' failed: %s", specialist.slug, exc, exc_info=True
-                )
-                result_text = f"Specialist '{specialist.slug}' failed: {exc}"
-            finally:
-                ctx.current_agent_label = previous_label
-
-            duration_ms = int((time.monotonic() - start) * 1000)
-            record = StepRecord(
-                tool=step_name,
-                args={"query": params.query},
-                result_preview=result_text[:RESULT_PREVIEW_CHARS],
-                duration_ms=duration_ms,
-                nested_steps=nested_steps or None,
-            )
-            steps.append(record)
-            if ctx.on_step_end:
-                await ctx.on_step_end(record)
-            return result_text
-
-        delegate_fn.__name__ = specialist.slug.replace("-", "_")
-        pyd_agent.tool_plain(  # type: ignore[call-overload]
-            delegate_fn,
-            name=delegate_fn.__name__,
-            description=(
-                f"Delegate to the '{specialist.name}' agent. {specialist.description}"
-            ),
-        )
-
     # ------------------------------------------------------------------
     # History
     # ------------------------------------------------------------------
@@ -307,3 +293,68 @@ class AgentRunner:
             elif turn.role == "assistant":
                 messages.append(ModelResponse(parts=[TextPart(content=turn.content)]))
         return messages
+
+
+@lru_cache(maxsize=1)
+def _utc_timestamp(epoch_seconds: int) -> str:
+    """Format once per second; concurrent runs in the same second share it."""
+    return datetime.fromtimestamp(epoch_seconds, UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+def _runtime_instructions(run_ctx: RunContext[_RunDeps]) -> str:
+    """Per-run instructions, rendered from the deps of the run being executed."""
+    return run_ctx.deps.runner.runtime_context(run_ctx.deps.ctx)
+
+
+# ----------------------------------------------------------------------
+# Tools
+# ----------------------------------------------------------------------
+# Tool objects (and the JSON schema pydantic-ai derives from each function)
+# are built once per tool / specialist and shared by every run; the
+# per-run context and step list arrive through ``_RunDeps``.
+
+
+@lru_cache(maxsize=256)
+def _spec_tool(
+    name: str, description: str, params_model: type[BaseModel], handler: ToolHandler
+) -> Tool[_RunDeps]:
+    async def tool_fn(run_ctx: RunContext[_RunDeps], params: params_model) -> str:  # type: ignore[valid-type]
+        ctx, steps = run_ctx.deps.ctx, run_ctx.deps.steps
+        args = params.model_dump(exclude_none=True)  # type: ignore[attr-defined]
+        if ctx.on_step_start:
+            await ctx.on_step_start(name, args)
+        start = time.monotonic()
+        try:
+            result_text = await handler(ctx, params)
+        except Exception as exc:  # noqa: BLE001 — errors return to the LLM as text
+            logger.error("Tool '%s' failed: %s", name, exc, exc_info=True)
+            result_text = f"Error in {name}: {exc}"
+        duration_ms = int((time.monotonic() - start) * 1000)
+        record = StepRecord(
+            tool=name,
+            args=args,
+            result_preview=result_text[:RESULT_PREVIEW_CHARS],
+            duration_ms=duration_ms,
+        )
+        steps.append(record)
+        if ctx.on_step_end:
+            await ctx.on_step_end(record)
+        return result_text
+
+    tool_fn.__name__ = name
+    return Tool(tool_fn, takes_ctx=True, name=name, description=description)
+
+
+@lru_cache(maxsize=256)
+def _specialist_tool(slug: str, name: str, description: str) -> Tool[_RunDeps]:
+    async def delegate_fn(run_ctx: RunContext[_RunDeps], params: DelegateParams) -> str:
+        deps = run_ctx.deps
+        return await deps.runner.delegate(slug, params.query, deps.ctx, deps.steps)
+
+    delegate_fn.__name__ = slug.replace("-", "_")
+    return Tool(
+        delegate_fn,
+        takes_ctx=True,
+        name=delegate_fn.__name__,
+        description=f"Delegate to the '{name}' agent. {description}",
+    )
@@ -16,6 +16,7 @@ from app.api.v1.dependencies import CurrentUserDep, SessionDep, SettingsDep
 from app.core.tracing import enqueue_for_review, score_session, score_trace
 from app.modules.agents.repository import AgentRepository
 from app.modules.chat.enums import ChatChannel, FeedbackRating, MessageRole
+from app.modules.guardrails.service import GuardrailService
 from app.modules.integrations.repository import IntegrationsRepository
 from app.modules.integrations.service import TelegramService
 
@@ -43,6 +44,16 @@ def build_chat_service(request: Request, session, settings) -> ChatService:
     return build_chat_service_from_state(request.app.state, session, settings)
 
 
+def _guardrail_service_for(state, settings) -> GuardrailService:
+    """The app-wide GuardrailService (and its verdict cache) when it was built
+    from these settings; otherwise a fresh one, so per-request settings and
+    dependency overrides apply to guardrails like to every other service."""
+    shared = getattr(state, "guardrail_service", None)
+    if shared is not None and shared.settings is settings:
+        return shared
+    return GuardrailService(settings)
+
+
 def build_chat_service_from_state(state, session, settings) -> ChatService:
     """Assemble the ChatService from app state — usable by HTTP handlers AND the
     Telegram polling loop (which has no Request)."""
@@ -126,6 +137,7 @@ def build_chat_service_from_state(state, session, settings) -> ChatService:
         agent_repository=AgentRepository(session),
         tool_registry=state.tool_registry,
         settings=settings,
+        guardrail_service=_guardrail_service_for(state, settings),
         vector_store=getattr(state, "vector_store", None),
         graph_store=getattr(state, "graph_store", None),
         human_forward_handler=telegram_service.forward_to_human,
@@ -3,6 +3,7 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .enums import MessageRole
 from .models import ChatMessage, ChatSession, MessageFeedback
 
 
@@ -48,10 +49,18 @@ class ChatRepository:
 
     # --- Messages ---------------------------------------------------------
 
-    async def add_message(self, message: ChatMessage) -> ChatMessage:
+    async def add_message(
+        self, message: ChatMessage, chat_session: ChatSession | None = None
+    ) -> ChatMessage:
+        """Store *message*; pending changes to *chat_session* (title, token
+        counters) are committed in the same transaction."""
         self.session.add(message)
+        if chat_session is not None:
+            self.session.add(chat_session)
         await self.session.commit()
         await self.session.refresh(message)
+        if chat_session is not None:
+            await self.session.refresh(chat_session)
         return message
 
     async def get_message(self, message_id: str) -> ChatMessage | None:
@@ -65,6 +74,31 @@ class ChatRepository:
         )
         return list(result.scalars().all())
 
+    async def list_history(
+        self, session_id: str, limit: int | None = None
+    ) -> list[tuple[str, str]]:
+        """``(role, content)`` of the user/assistant messages, oldest first —
+        only the most recent *limit* of them when given. Ties on ``created_at``
+        are broken by ``id`` so the window and its order are deterministic.
+
+        Selects only the two columns the agent history needs, so the JSON
+        ``steps``/``usage`` columns are never loaded or decoded.
+        """
+        query = (
+            select(ChatMessage.role, ChatMessage.content)
+            .where(
+                ChatMessage.session_id == session_id,
+                ChatMessage.role.in_((MessageRole.USER, MessageRole.ASSISTANT)),
+            )
+            .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        history = [(role, content) for role, content in result.all()]
+        history.reverse()
+        return history
+
     # --- Feedback ---------------------------------------------------------
 
     async def upsert_feedback(self, feedback: MessageFeedback) -> MessageFeedback:
@@ -3,6 +3,9 @@
 Pipeline per turn:
     input guardrail → (handoff check) → agent runner → output guardrail → persist
 
+The input guardrail's LLM call overlaps with loading the agent, specialists
+and history; the agent only runs once the verdict is in.
+
 While a session is handed off to a human (state != BOT) the LLM is NOT called:
 messages are stored and forwarded to the human channel.
 """
@@ -14,7 +17,7 @@ from collections.abc import AsyncIterator, Awaitable, Callable
 from app.core.config import Settings
 from app.modules.agents.models import Agent
 from app.modules.agents.repository import AgentRepository
-from app.modules.agents.runner import AgentRunner, HistoryTurn
+from app.modules.agents.runner import MAX_HISTORY_MESSAGES, AgentRunner, HistoryTurn
 from app.modules.guardrails.enums import GuardrailVerdictType
 from app.modules.guardrails.service import GuardrailService
 from app.modules.tools.service import ToolRegistry, ToolRunContext
@@ -239,15 +242,15 @@ class ChatService:
     ) -> ChatMessageRead:
         """Shared pipeline. When *emit* is set, live events are produced and the
         final answer is streamed token-by-token; otherwise a single blocking run."""
+        # Auto-title the session from the first message (saved with the message)
+        retitled = session.title == "New conversation"
+        if retitled:
+            session.title = content[:60] + ("…" if len(content) > 60 else "")
         await self.repository.add_message(
-            ChatMessage(session_id=session.id, role=MessageRole.USER, content=content)
+            ChatMessage(session_id=session.id, role=MessageRole.USER, content=content),
+            session if retitled else None,
         )
 
-        # Auto-title the session from the first message
-        if session.title == "New conversation":
-            session.title = content[:60] + ("…" if len(content) > 60 else "")
-            await self.repository.save_session(session)
-
         # Handoff: while a human owns the conversation, the LLM stays out
         if session.handoff_state != HandoffState.BOT:
             if self.human_forward_handler:
@@ -262,10 +265,25 @@ class ChatService:
             )
             return ChatMessageRead.model_validate(assistant)
 
-        # Input guardrail
+        # Input guardrail. Verdicts decided locally (disabled, blocklist,
+        # allowlist, cache) need no prep; otherwise the LLM judge runs while
+        # the turn is prepared (agent, specialists, history), and the verdict
+        # is awaited before the agent runs.
         if emit:
             await emit({"type": "step_started", "tool": "guardrail:input"})
-        verdict = await self.guardrail_service.validate_input(content)
+        prepared: tuple[Agent, list[Agent], list[tuple[str, str]]] | None = None
+        prep_error: Exception | None = None
+        verdict = self.guardrail_service.local_input_verdict(content)
+        if verdict is None:
+            input_check = asyncio.create_task(self.guardrail_service.validate_input(content))
+            try:
+                prepared = await self._prepare_turn(session)
+            except Exception as exc:  # noqa: BLE001 — a blocked input still gets its refusal
+                prep_error = exc
+            except BaseException:
+                input_check.cancel()
+                raise
+            verdict = await input_check
         if emit:
             await emit(
                 {"type": "step_finished", "tool": "guardrail:input",
@@ -284,10 +302,9 @@ class ChatService:
                 )
             )
             return ChatMessageRead.model_validate(assistant)
-
-        # Resolve agent (session-specific or default router)
-        agent = await self._resolve_agent(session)
-        specialists = await self.agent_repository.list_enabled_specialists()
+        if prep_error is not None:
+            raise prep_error
+        agent, specialists, recent = prepared or await self._prepare_turn(session)
 
         ctx = ToolRunContext(
             settings=self.settings,
@@ -312,11 +329,7 @@ class ChatService:
             ),
         )
 
-        history = [
-            HistoryTurn(role=m.role, content=m.content)
-            for m in await self.repository.list_messages(session.id)
-            if m.role in (MessageRole.USER, MessageRole.ASSISTANT)
-        ][:-1]  # exclude the message we just stored (it goes as the prompt)
+        history = [HistoryTurn(role=role, content=text) for role, text in recent][:-1]
 
         runner = AgentRunner(self.settings, self.tool_registry, specialists)
         try:
@@ -354,6 +367,8 @@ class ChatService:
             if emit:
                 await emit({"type": "revised", "content": final_text})
 
+        session.input_tokens += outcome.input_tokens
+        session.output_tokens += outcome.output_tokens
         assistant = await self.repository.add_message(
             ChatMessage(
                 session_id=session.id,
@@ -365,14 +380,26 @@ class ChatService:
                     "output_tokens": outcome.output_tokens,
                 },
                 trace_id=trace_id,
-            )
+            ),
+            session,
         )
-        session.input_tokens += outcome.input_tokens
-        session.output_tokens += outcome.output_tokens
-        await self.repository.save_session(session)
 
         return ChatMessageRead.model_validate(assistant)
 
+    async def _prepare_turn(
+        self, session: ChatSession
+    ) -> tuple[Agent, list[Agent], list[tuple[str, str]]]:
+        """Load what the agent run needs: agent, specialists, recent history."""
+        # Resolve agent (session-specific or default router)
+        agent = await self._resolve_agent(session)
+        specialists = await self.agent_repository.list_enabled_specialists()
+        # The runner only sends the last MAX_HISTORY_MESSAGES turns; +1 for
+        # the message we just stored, which is excluded (it goes as the prompt)
+        recent = await self.repository.list_history(
+            session.id, limit=MAX_HISTORY_MESSAGES + 1
+        )
+        return agent, specialists, recent
+
     async def _resolve_agent(self, session: ChatSession) -> Agent:
         if session.agent_id:
             agent = await self.agent_repository.get(session.agent_id)
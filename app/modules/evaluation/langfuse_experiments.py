@@ -41,13 +41,11 @@ class ExperimentUnavailableError(Exception):
 
 
 def _require_langfuse():
-    from app.core.tracing import is_tracing_enabled
+    from app.core.tracing import get_langfuse, is_tracing_enabled
 
     if not is_tracing_enabled():
         raise ExperimentUnavailableError("Langfuse tracing is not enabled")
-    from langfuse import get_client
-
-    return get_client()
+    return get_langfuse()
 
 
 # ---------------------------------------------------------------------------
@@ -6,9 +6,26 @@ Policy:
 - Output guardrail: fail-closed for sensitive-data leaks — if the validator
   errors while the response mentions sensitive markers, the response is
   replaced with a safe fallback.
+- Short inputs matching the configured allowlist (greetings, thanks) are
+  allowed without an LLM call; inputs containing a known injection phrase
+  (blocklist) are blocked without one.
+- Input verdicts from the LLM are cached per exact message for a short TTL,
+  so repeated messages (and repeated injection probes) skip the LLM call.
+  Fail-open verdicts from errors are never cached.
+- Long inputs are judged in full: above MAX_GUARDRAIL_MESSAGE_CHARS the
+  message is split into overlapping windows judged concurrently, and any
+  BLOCK window blocks the message. Inputs above MAX_GUARDRAIL_INPUT_CHARS are
+  blocked without an LLM call rather than judged from a partial view.
+- The output guardrail sees the customer message only as context, as a
+  head + tail sample when it is long; the agent draft is always sent whole.
 """
 
+import asyncio
+import hashlib
 import logging
+import re
+import time
+from collections import OrderedDict
 
 from pydantic_ai import Agent as PydanticAgent
 from pydantic_ai.settings import ModelSettings
@@ -51,36 +68,167 @@ response with the problem removed, in the same language.
 
 _SENSITIVE_MARKERS = ("cpf", "cnpj", "senha", "password", "token", "card number", "cartão")
 
+# Prompt size is what drives guardrail latency, so no guardrail prompt carries
+# more than this much customer text. Longer inputs are judged as overlapping
+# windows (the overlap keeps a phrase on a boundary whole in one window); the
+# output guardrail, which only needs the message as context, gets a head + tail
+# sample instead.
+MAX_GUARDRAIL_MESSAGE_CHARS = 4000
+_GUARDRAIL_WINDOW_OVERLAP_CHARS = 200
+_GUARDRAIL_HEAD_CHARS = 2500
+_GUARDRAIL_TAIL_CHARS = 1000
+# Inputs past this would fan out into too many guardrail calls to judge.
+MAX_GUARDRAIL_INPUT_CHARS = 40_000
+
 _FALLBACK_BLOCK_MESSAGE = (
     "Desculpe, não consigo ajudar com isso. Posso ajudar com produtos Getnet "
     "ou questões da sua conta."
 )
 
 
+def _sample_message(text: str) -> str:
+    """*text* itself, or a head + tail sample when it is too long to judge whole."""
+    if len(text) <= MAX_GUARDRAIL_MESSAGE_CHARS:
+        return text
+    return f"{text[:_GUARDRAIL_HEAD_CHARS]}\n…[TRUNCATED]…\n{text[-_GUARDRAIL_TAIL_CHARS:]}"
+
+
+def _message_windows(text: str) -> list[str]:
+    """*text* split into overlapping windows of at most MAX_GUARDRAIL_MESSAGE_CHARS."""
+    if len(text) <= MAX_GUARDRAIL_MESSAGE_CHARS:
+        return [text]
+    step = MAX_GUARDRAIL_MESSAGE_CHARS - _GUARDRAIL_WINDOW_OVERLAP_CHARS
+    return [
+        text[start : start + MAX_GUARDRAIL_MESSAGE_CHARS]
+        for start in range(0, len(text) - _GUARDRAIL_WINDOW_OVERLAP_CHARS, step)
+    ]
+
+
+def _compile_any(patterns: list[str]) -> re.Pattern[str] | None:
+    """One case-insensitive regex matching any of *patterns* (None when empty)."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+class _VerdictCache:
+    """Bounded LRU of verdicts keyed by message digest, with a TTL per entry."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, GuardrailVerdict]] = OrderedDict()
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> GuardrailVerdict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, verdict = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return verdict
+
+    def put(self, key: bytes, verdict: GuardrailVerdict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, verdict)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
 class GuardrailService:
+    """Shared across requests (one per app, see ``app.state.guardrail_service``).
+
+    The shared instance is built from the startup settings; chat requests
+    resolved with different settings get their own instance (and cache).
+    """
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        self._agents: dict[str, PydanticAgent[None, GuardrailVerdict]] = {}
+        self._input_cache = _VerdictCache(
+            settings.guardrail_cache_size, settings.guardrail_cache_ttl_seconds
+        )
+        self._input_allowlist = _compile_any(settings.guardrail_input_allowlist)
+        self._input_blocklist = _compile_any(settings.guardrail_input_blocklist)
 
     def _agent(self, instructions: str) -> "PydanticAgent[None, GuardrailVerdict]":
-        return PydanticAgent(
-            model=self.settings.guardrail_model,
-            instructions=instructions,
-            output_type=GuardrailVerdict,
-            model_settings=ModelSettings(timeout=self.settings.guardrail_timeout_seconds),
+        # Built on first use (inside the callers' fail-open handling) and then
+        # reused: a pydantic-ai Agent holds no per-run state, so concurrent
+        # turns can share it.
+        agent = self._agents.get(instructions)
+        if agent is None:
+            agent = PydanticAgent(
+                model=self.settings.guardrail_model,
+                instructions=instructions,
+                output_type=GuardrailVerdict,
+                model_settings=ModelSettings(timeout=self.settings.guardrail_timeout_seconds),
+            )
+            self._agents[instructions] = agent
+        return agent
+
+    def _is_allowlisted(self, user_message: str) -> bool:
+        text = user_message.strip()
+        return (
+            self._input_allowlist is not None
+            and len(text) <= self.settings.guardrail_allowlist_max_chars
+            and self._input_allowlist.fullmatch(text) is not None
         )
 
-    async def validate_input(self, user_message: str) -> GuardrailVerdict:
+    def local_input_verdict(self, user_message: str) -> GuardrailVerdict | None:
+        """The input verdict when it is decided without the LLM — guardrails
+        disabled, blocklist, size cap, allowlist or cache — else None."""
         if not self.settings.guardrails_enabled:
             return GuardrailVerdict(
                 verdict=GuardrailVerdictType.ALLOW,
                 category=GuardrailCategory.SAFE,
                 reason="Guardrails disabled",
             )
-        try:
-            result = await self._agent(_INPUT_INSTRUCTIONS).run(
-                f"Customer message:\n{user_message}"
+        if self._input_blocklist is not None and self._input_blocklist.search(user_message):
+            logger.info("Input blocked by local blocklist (no LLM call)")
+            return GuardrailVerdict(
+                verdict=GuardrailVerdictType.BLOCK,
+                category=GuardrailCategory.PROMPT_INJECTION,
+                reason="Matched input blocklist",
+                safe_response=_FALLBACK_BLOCK_MESSAGE,
             )
-            return result.output
+        if len(user_message) > MAX_GUARDRAIL_INPUT_CHARS:
+            logger.info("Input blocked by size cap (no LLM call): %d chars", len(user_message))
+            return GuardrailVerdict(
+                verdict=GuardrailVerdictType.BLOCK,
+                category=GuardrailCategory.ABUSE,
+                reason="Input too long to judge",
+                safe_response=_FALLBACK_BLOCK_MESSAGE,
+            )
+        if self._is_allowlisted(user_message):
+            return GuardrailVerdict(
+                verdict=GuardrailVerdictType.ALLOW,
+                category=GuardrailCategory.SAFE,
+                reason="Matched input allowlist",
+            )
+        return self._input_cache.get(_VerdictCache.key(user_message))
+
+    async def validate_input(self, user_message: str) -> GuardrailVerdict:
+        local = self.local_input_verdict(user_message)
+        if local is not None:
+            return local
+        windows = _message_windows(user_message)
+        try:
+            agent = self._agent(_INPUT_INSTRUCTIONS)
+            if len(windows) == 1:
+                results = [await agent.run(f"Customer message:\n{user_message}")]
+            else:
+                results = await asyncio.gather(
+                    *(
+                        agent.run(f"Customer message (part {i} of {len(windows)}):\n{window}")
+                        for i, window in enumerate(windows, start=1)
+                    )
+                )
         except Exception as exc:  # noqa: BLE001
             logger.error("Input guardrail error (fail-open): %s", exc)
             return GuardrailVerdict(
@@ -88,6 +236,13 @@ class GuardrailService:
                 category=GuardrailCategory.SAFE,
                 reason=f"Guardrail error, fail-open: {exc}",
             )
+        verdict = next(
+            (r.output for r in results if r.output.verdict == GuardrailVerdictType.BLOCK),
+            results[0].output,
+        )
+        # Outside the try: only the LLM call may fail open, never the cache
+        self._input_cache.put(_VerdictCache.key(user_message), verdict)
+        return verdict
 
     async def validate_output(self, agent_response: str, user_message: str) -> GuardrailVerdict:
         if not self.settings.guardrails_enabled:
@@ -98,7 +253,8 @@ class GuardrailService:
             )
         try:
             result = await self._agent(_OUTPUT_INSTRUCTIONS).run(
-                f"Customer message:\n{user_message}\n\nAgent draft response:\n{agent_response}"
+                f"Customer message:\n{_sample_message(user_message)}\n\n"
+                f"Agent draft response:\n{agent_response}"
             )
             return result.output
         except Exception as exc:  # noqa: BLE001
@@ -1,3 +1,5 @@
+-- Tables only; secondary indexes live in schema_indexes.sql (applied after seeding).
+
 -- Enable foreign keys
 PRAGMA foreign_keys = ON;
 
@@ -0,0 +1,9 @@
+-- Secondary indexes, applied after the seed data is loaded so each B-tree is
+-- built once from sorted data instead of maintained row by row.
+
+-- Customer → merchant resolution (every support tool call)
+CREATE INDEX idx_merchants_user_id ON merchants(user_id);
+
+-- Recent operations, newest first, per merchant
+CREATE INDEX idx_transfers_merchant_created ON transfers(merchant_id, created_at);
+CREATE INDEX idx_devices_merchant_id ON devices(merchant_id);
@@ -0,0 +1,77 @@
+"""Unit tests: ChatRepository.list_history — the window the agent runner receives."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.db import Database
+from app.modules.agents.runner import MAX_HISTORY_MESSAGES
+from app.modules.chat.enums import MessageRole
+from app.modules.chat.models import ChatMessage, ChatSession
+from app.modules.chat.repository import ChatRepository
+
+pytestmark = pytest.mark.anyio
+
+T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def db():
+    database = Database("sqlite+aiosqlite://")
+    await database.create_all()
+    yield database
+    await database.dispose()
+
+
+async def test_history_window_is_the_most_recent_turns_oldest_first(db):
+    total = MAX_HISTORY_MESSAGES + 6
+    async with db.session_factory() as session:
+        repository = ChatRepository(session)
+        chat = await repository.create_session(ChatSession(title="history"))
+        for n in range(total):
+            role = MessageRole.USER if n % 2 == 0 else MessageRole.ASSISTANT
+            await repository.add_message(
+                ChatMessage(
+                    session_id=chat.id,
+                    role=role,
+                    content=f"m{n}",
+                    created_at=T0 + timedelta(seconds=n),
+                )
+            )
+        # A system message (handoff ack) inside the window is never history
+        await repository.add_message(
+            ChatMessage(
+                session_id=chat.id,
+                role=MessageRole.SYSTEM,
+                content="handoff",
+                created_at=T0 + timedelta(seconds=total - 2, milliseconds=500),
+            )
+        )
+
+        history = await repository.list_history(chat.id, limit=MAX_HISTORY_MESSAGES + 1)
+
+    expected = range(total - MAX_HISTORY_MESSAGES - 1, total)
+    assert [content for _, content in history] == [f"m{n}" for n in expected]
+    assert MessageRole.SYSTEM not in {role for role, _ in history}
+
+
+async def test_history_breaks_created_at_ties_by_id(db):
+    async with db.session_factory() as session:
+        repository = ChatRepository(session)
+        chat = await repository.create_session(ChatSession(title="ties"))
+        for message_id in ("b" * 32, "a" * 32, "c" * 32):
+            await repository.add_message(
+                ChatMessage(
+                    id=message_id,
+                    session_id=chat.id,
+                    role=MessageRole.USER,
+                    content=message_id[0],
+                    created_at=T0,
+                )
+            )
+
+        window = await repository.list_history(chat.id, limit=2)
+        full = await repository.list_history(chat.id)
+
+    assert [content for _, content in full] == ["a", "b", "c"]
+    assert [content for _, content in window] == ["b", "c"]
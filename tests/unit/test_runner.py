@@ -1,6 +1,9 @@
 """Unit tests: AgentRunner — instructions, history, steps, delegation (mocked model)."""
 
+import asyncio
+
 import pytest
+from pydantic import ValidationError
 
 from app.core.config import Settings
 from app.modules.agents.enums import AgentKind
@@ -98,3 +101,103 @@ async def test_unknown_tool_is_skipped_gracefully():
     runner = AgentRunner(SETTINGS, build_default_registry(), [])
     outcome = await runner.run(agent, "hi", [], make_ctx())
     assert outcome.text  # run succeeds; unknown tool just isn't registered
+
+
+async def test_parallel_delegations_do_not_relabel_the_shared_context():
+    specialists = [
+        make_agent(
+            id=f"a{n}",
+            slug=f"helper-{n}",
+            name=f"Helper {n}",
+            kind=AgentKind.SPECIALIST,
+            expose_as_tool=True,
+            model="test",
+            description="Helps with things",
+        )
+        for n in (2, 3)
+    ]
+    router = make_agent(model="test")
+    runner = AgentRunner(SETTINGS, build_default_registry(), specialists)
+    ctx = make_ctx()
+    outcome = await runner.run(router, "delegate to both", [], ctx)
+    assert {"agent:helper-2", "agent:helper-3"} <= {s.tool for s in outcome.steps}
+    assert ctx.current_agent_label == router.name
+
+
+class _TrackingSlots(asyncio.Semaphore):
+    """Semaphore that records how many holders it had at once."""
+
+    def __init__(self, value: int) -> None:
+        super().__init__(value)
+        self.in_use = 0
+        self.peak = 0
+
+    async def __aenter__(self):
+        await super().__aenter__()
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        await asyncio.sleep(0.01)  # hold the slot so siblings overlap
+
+    async def __aexit__(self, *exc_info):
+        self.in_use -= 1
+        return await super().__aexit__(*exc_info)
+
+
+async def test_concurrent_delegations_are_bounded_by_the_limit():
+    specialists = [
+        make_agent(
+            id=f"s{n}",
+            slug=f"helper-{n}",
+            name=f"Helper {n}",
+            kind=AgentKind.SPECIALIST,
+            expose_as_tool=True,
+            model="test",
+            description="Helps with things",
+        )
+        for n in range(5)
+    ]
+    settings = SETTINGS.model_copy(update={"max_concurrent_specialists": 2})
+    runner = AgentRunner(settings, build_default_registry(), specialists)
+    runner._specialist_slots = slots = _TrackingSlots(settings.max_concurrent_specialists)
+    outcome = await runner.run(make_agent(model="test"), "delegate to all", [], make_ctx())
+    assert sum(s.tool.startswith("agent:") for s in outcome.steps) == 5
+    assert slots.peak == 2
+
+
+def test_specialist_limit_must_be_positive():
+    with pytest.raises(ValidationError):
+        Settings(max_concurrent_specialists=0)
+
+
+async def test_agent_is_built_once_per_runner_with_per_run_context():
+    from pydantic_ai import capture_run_messages
+
+    agent = make_agent(model="test")
+    runner = AgentRunner(SETTINGS, build_default_registry(), [])
+    first, _ = runner._build_agent(agent, include_specialists=True)
+    again, _ = runner._build_agent(agent, include_specialists=True)
+    assert first is again
+
+    with capture_run_messages() as messages:
+        await runner.run(agent, "hello", [], make_ctx())
+    # Runtime context is rendered per run from deps, not baked into the agent
+    assert "user-1" in messages[0].instructions
+
+
+async def test_delegate_runs_specialist_and_records_step():
+    specialist = make_agent(
+        id="a2",
+        slug="helper",
+        name="Helper",
+        kind=AgentKind.SPECIALIST,
+        expose_as_tool=True,
+        model="test",
+        tools=["get_active_incidents"],
+    )
+    runner = AgentRunner(SETTINGS, build_default_registry(), [specialist])
+    steps = []
+    text = await runner.delegate("helper", "any incidents?", make_ctx(), steps)
+    assert text
+    assert [s.tool for s in steps] == ["agent:helper"]
+    assert steps[0].args == {"query": "any incidents?"}
+    assert steps[0].nested_steps